@@ -33,8 +33,7 @@ class Eolic(metaclass=Singleton):
         Args:
             remote_targets (List[Any]): A list of remote targets to register.
         """
-        for remote_target in remote_targets:
-            self.register_target(remote_target)
+        self.remote_target_handler.register_many(remote_targets)
 
     def register_target(self, target: Any) -> None:
         """
@@ -0,0 +1,55 @@
+"""Module for eolic settings."""
+
+import os
+from functools import lru_cache
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+
+class Settings(BaseModel):
+    """
+    Model for eolic settings.
+
+    Every setting can be overridden with an environment variable named after it
+    with the EOLIC_ prefix, e.g. EOLIC_MAX_WORKERS.
+
+    Attributes:
+        max_workers: Maximum number of threads running blocking remote dispatches,
+            must be greater than 0, default: min(32, cpu count + 4).
+    """
+
+    max_workers: int = Field(
+        default_factory=lambda: min(32, (os.cpu_count() or 1) + 4), gt=0
+    )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build the settings from the EOLIC_ environment variables.
+
+        Returns:
+            Settings: The settings read from the environment.
+        """
+        values: Dict[str, str] = {}
+
+        for name in cls.model_fields:
+            env_value = os.environ.get(f"EOLIC_{name.upper()}")
+
+            if env_value is not None:
+                values[name] = env_value
+
+        return cls.model_validate(values)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the eolic settings, read from the environment once per process.
+
+    Use get_settings.cache_clear() to read them again.
+
+    Returns:
+        Settings: The eolic settings.
+    """
+    return Settings.from_env()
@@ -1,9 +1,9 @@
 """Module for FastAPI integration."""
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from ..base import Integration
-from ..model import EventDTO
+from ..model import EventBatchDTO, EventDTO
 from ..helpers.modules import is_module_installed
 
 if TYPE_CHECKING:
@@ -53,6 +53,12 @@ class FastAPIIntegration(Integration):
             raise Exception("Event route is required for FastAPI integration.")
 
         @self.app.post(event_route)
-        async def emit_event(event: EventDTO):
-            self.forward_event(event)
+        async def emit_event(event: Union[EventBatchDTO, EventDTO]):
+            # Batching remote targets post {"events": [...]}
+            if isinstance(event, EventBatchDTO):
+                for batched_event in event.events:
+                    self.forward_event(batched_event)
+            else:
+                self.forward_event(event)
+
             return {}
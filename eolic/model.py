@@ -1,9 +1,20 @@
 """Module for eolic models."""
 
 from enum import Enum
-from typing import Mapping, Tuple, Any, Callable, Dict, List, Optional
-
-from pydantic import BaseModel
+from typing import (
+    Annotated,
+    Literal,
+    Mapping,
+    Tuple,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class EventDTO(BaseModel):
@@ -20,6 +31,17 @@ class EventDTO(BaseModel):
     kwargs: Mapping = {}
 
 
+class EventBatchDTO(BaseModel):
+    """
+    Model for batches of event data transfer objects.
+
+    Attributes:
+        events: The events sent together by a batching remote target.
+    """
+
+    events: List[EventDTO]
+
+
 class EventRemoteTargetType(str, Enum):
     """
     Enum for types of event remote targets.
@@ -39,12 +61,17 @@ class EventRemoteTarget(BaseModel):
     """
     Base model for event remote targets.
 
+    Targets are frozen: dispatchers and event routing are built from them once, on
+    registration.
+
     Attributes:
         type: The type of the remote target.
         address: The address of the remote target.
         events: Optional list of events that the target is interested in.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: EventRemoteTargetType
     address: str
     events: Optional[List[Any]] = None
@@ -55,10 +82,18 @@ class EventRemoteURLTarget(EventRemoteTarget):
     Model for URL event remote targets.
 
     Attributes:
+        type: The type of the remote target, always url.
         headers: Dictionary of headers to include in requests to the target.
+        batch_size: Optional number of events sent together in a single request,
+            default: None (one request per event).
+        flush_interval_ms: Maximum time in milliseconds an event waits in a batch
+            before it is sent, default: 100.
     """
 
+    type: Literal[EventRemoteTargetType.url] = EventRemoteTargetType.url
     headers: Dict[str, Any] = {}
+    batch_size: Optional[int] = Field(default=None, gt=0)
+    flush_interval_ms: int = Field(default=100, gt=0)
 
 
 class EventRemoteCeleryTarget(EventRemoteTarget):
@@ -66,14 +101,27 @@ class EventRemoteCeleryTarget(EventRemoteTarget):
     Model for Celery event remote targets.
 
     Attributes:
+        type: The type of the remote target, always celery.
         queue_name: String of queue used in celery worker, default: eolic.
         function_name: String of function name used in celery worker, default: events.
     """
 
+    type: Literal[EventRemoteTargetType.celery] = EventRemoteTargetType.celery
     queue_name: str = "eolic"
     function_name: str = "events"
 
 
+EventRemoteTargetListAdapter = TypeAdapter(
+    List[
+        Annotated[
+            Union[EventRemoteURLTarget, EventRemoteCeleryTarget],
+            Field(discriminator="type"),
+        ]
+    ]
+)
+"""Adapter validating a list of remote targets, picking each model by its type."""
+
+
 class EventListener(BaseModel):
     """
     Model for event listeners.
@@ -7,24 +7,104 @@ to remote targets, and handling different types of event remote targets.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-import requests
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic_core import to_json
 
 from .task_manager import TaskManager
 
 from .helpers.coroutines import run_coroutine
 
 from .model import (
-    EventDTO,
     EventRemoteTarget,
     EventRemoteTargetType,
     EventRemoteURLTarget,
     EventRemoteCeleryTarget,
+    EventRemoteTargetListAdapter,
 )
 from .helpers.modules import is_module_installed, get_module
+from .config import get_settings
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from requests import Session
+
+_TARGET_TYPE_ERROR = "Target needs to be of type str or Dict[str, str] but received {}"
+_TARGET_KIND_ERROR = "Target type needs to be of type str but received {}"
+
+
+def _normalize_url_target(target: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize the fields of a URL remote target definition.
+
+    Args:
+        target (Dict[str, Any]): The target definition.
+
+    Returns:
+        Dict[str, Any]: The fields of the URL remote target.
+    """
+    fields = {
+        "type": EventRemoteTargetType.url,
+        "address": target["address"],
+        "headers": target.get("headers", {}),
+        "events": target.get("events"),
+    }
+
+    # Batch settings are only passed when given, the model holds their defaults
+    for name in ("batch_size", "flush_interval_ms"):
+        if name in target:
+            fields[name] = target[name]
+
+    return fields
+
+
+def _normalize_celery_target(target: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize the fields of a Celery remote target definition.
+
+    Empty queue_name and function_name fall back to the model defaults.
+
+    Args:
+        target (Dict[str, Any]): The target definition.
+
+    Returns:
+        Dict[str, Any]: The fields of the Celery remote target.
+    """
+    fields = {
+        "type": EventRemoteTargetType.celery,
+        "address": str(target["address"]),
+        "events": target.get("events"),
+    }
+
+    for name in ("queue_name", "function_name"):
+        value = target.get(name)
+
+        if value:
+            fields[name] = str(value)
+
+    return fields
 
 
 class EventRemoteTargetHandler(TaskManager):
@@ -33,83 +113,122 @@ class EventRemoteTargetHandler(TaskManager):
 
     Attributes:
         targets (List[EventRemoteTarget]): List of registered remote targets.
-        futures (List[Future]): List of futures for asynchronous tasks.
+        _wildcard_dispatchers (List[EventRemoteDispatcher]): Dispatchers of targets
+            interested in every event.
+        _dispatcher_map (Dict[Any, List[EventRemoteDispatcher]]): Mapping of events to the
+            dispatchers of targets interested in them.
+        _target_normalizers (Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]): Mapping
+            of target types to the functions normalizing their definitions.
         executor (ThreadPoolExecutor): Executor for handling asynchronous tasks.
     """
 
-    targets: List[EventRemoteTarget] = []
+    targets: List[EventRemoteTarget]
+    _wildcard_dispatchers: List[EventRemoteDispatcher]
+    _dispatcher_map: Dict[Any, List[EventRemoteDispatcher]]
+    _target_normalizers: ClassVar[
+        Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]
+    ] = {
+        EventRemoteTargetType.url: _normalize_url_target,
+        EventRemoteTargetType.celery: _normalize_celery_target,
+    }
+
+    def __init__(
+        self, max_workers: Optional[int] = None, track_tasks: bool = True
+    ) -> None:
+        """
+        Initialize the EventRemoteTargetHandler.
+
+        Args:
+            max_workers (Optional[int]): Maximum number of threads running blocking
+                dispatches, defaults to the max_workers setting (EOLIC_MAX_WORKERS).
+            track_tasks (bool): Whether to keep track of dispatch tasks. When False,
+                dispatches are fire-and-forget and wait_for_all only flushes batches.
+        """
+        super().__init__(track_tasks)
+        self.targets = []
+        self._wildcard_dispatchers = []
+        self._dispatcher_map = {}
 
-    def __init__(self) -> None:
-        """Initialize the EventRemoteTargetHandler."""
-        super().__init__()
+        if max_workers is None:
+            max_workers = get_settings().max_workers
 
-    @staticmethod
-    def _parse_target(target: Union[str, Dict[str, Any]]) -> EventRemoteTarget:
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._dispatcher_factory = EventRemoteDispatcherFactory(
+            self.executor, max_workers
+        )
+        self._async_client: Optional[AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._httpx_installed: Optional[bool] = None
+
+    @classmethod
+    def _normalize_target(cls, target: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Parse and convert a target to an EventRemoteTarget instance.
+        Check a target and normalize the fields of its known type.
 
         Args:
-            target (Any): The target to parse, can be a string or a dictionary.
+            target (Any): The target to normalize, can be a string or a dictionary.
 
         Returns:
-            EventRemoteTarget: Parsed remote target.
+            Dict[str, Any]: The target fields, unchanged for types without a normalizer.
         """
         if isinstance(target, str):
             target = {"type": "url", "address": target}
 
         if not isinstance(target, dict):
-            raise TypeError(
-                "Target needs to be of type str or Dict[str, str] but received {}".format(
-                    type(target)
-                )
-            )
+            raise TypeError(_TARGET_TYPE_ERROR.format(type(target)))
 
         target_type = target.get("type")
 
         if not isinstance(target_type, str):
-            raise TypeError(
-                "Target type needs to be of type str but received {}".format(
-                    type(target_type)
-                )
-            )
+            raise TypeError(_TARGET_KIND_ERROR.format(type(target_type)))
 
-        event_remote_target_type = EventRemoteTargetType[target_type]
+        normalizer = cls._target_normalizers.get(target_type)
 
-        if event_remote_target_type == EventRemoteTargetType.url:
-            return EventRemoteURLTarget(
-                type=event_remote_target_type,
-                address=target["address"],
-                headers=target.get("headers", {}),
-                events=target.get("events"),
-            )
+        if normalizer is None:
+            return target
 
-        elif event_remote_target_type == EventRemoteTargetType.celery:
-            address = str(target["address"])
-            events: Optional[List[Any]] = target.get("events")
+        return normalizer(target)
 
-            queue_name = (
-                str(target.get("queue_name")) if target.get("queue_name") else None
-            )
-            function_name = (
-                str(target.get("function_name"))
-                if target.get("function_name")
-                else None
-            )
+    @classmethod
+    def _parse_targets(cls, targets: List[Any]) -> List[EventRemoteTarget]:
+        """
+        Parse and convert targets to EventRemoteTarget instances.
 
-            optional_kwargs = {}
+        Targets of known types are validated together in a single pass.
 
-            if queue_name:
-                optional_kwargs["queue_name"] = queue_name
-            if function_name:
-                optional_kwargs["function_name"] = function_name
+        Args:
+            targets (List[Any]): The targets to parse, each a string or a dictionary.
 
-            return EventRemoteCeleryTarget(
-                type=event_remote_target_type,
-                address=address,
-                events=events,
-                **optional_kwargs,
+        Returns:
+            List[EventRemoteTarget]: Parsed remote targets, in the given order.
+        """
+        normalized = [cls._normalize_target(target) for target in targets]
+        known = [
+            fields for fields in normalized if fields["type"] in cls._target_normalizers
+        ]
+        validated = iter(EventRemoteTargetListAdapter.validate_python(known))
+
+        return [
+            (
+                next(validated)
+                if fields["type"] in cls._target_normalizers
+                else EventRemoteTarget(**fields)
             )
-        return EventRemoteTarget(**target)
+            for fields in normalized
+        ]
+
+    @classmethod
+    def _parse_target(cls, target: Union[str, Dict[str, Any]]) -> EventRemoteTarget:
+        """
+        Parse and convert a target to an EventRemoteTarget instance.
+
+        Args:
+            target (Any): The target to parse, can be a string or a dictionary.
+
+        Returns:
+            EventRemoteTarget: Parsed remote target.
+        """
+        return cls._parse_targets([target])[0]
 
     def register(self, target: Any) -> None:
         """
@@ -118,11 +237,50 @@ class EventRemoteTargetHandler(TaskManager):
         Args:
             target (Any): The target to register.
         """
-        self.targets.append(self._parse_target(target))
+        self.register_many([target])
+
+    def register_many(self, targets: List[Any]) -> None:
+        """
+        Register several remote targets, validating them all in a single pass.
+
+        Nothing is registered if any of the targets is invalid.
+
+        Args:
+            targets (List[Any]): The targets to register, each a string or a dictionary.
+        """
+        parsed_targets = self._parse_targets(targets)
+        dispatchers = [
+            self._dispatcher_factory.create(parsed_target)
+            for parsed_target in parsed_targets
+        ]
+
+        for parsed_target, dispatcher in zip(parsed_targets, dispatchers):
+            self._add_target(parsed_target, dispatcher)
+
+    def _add_target(
+        self, parsed_target: EventRemoteTarget, dispatcher: EventRemoteDispatcher
+    ) -> None:
+        """
+        Add a parsed target and route its dispatcher by the events it is interested in.
+
+        Args:
+            parsed_target (EventRemoteTarget): The parsed target to add.
+            dispatcher (EventRemoteDispatcher): The dispatcher built for the target.
+        """
+        self.targets.append(parsed_target)
+
+        if parsed_target.events is None:
+            self._wildcard_dispatchers.append(dispatcher)
+            return
+
+        for event in dict.fromkeys(parsed_target.events):
+            self._dispatcher_map.setdefault(event, []).append(dispatcher)
 
     def clear(self) -> None:
         """Clear all registered targets and futures."""
         self.targets.clear()
+        self._wildcard_dispatchers.clear()
+        self._dispatcher_map.clear()
 
     def emit(self, event: Any, *args, **kwargs) -> None:
         """
@@ -144,18 +302,177 @@ class EventRemoteTargetHandler(TaskManager):
             *args: Variable length argument list for the event.
             **kwargs: Arbitrary keyword arguments for the event.
         """
-        dispatcher_factory = EventRemoteDispatcherFactory()
+        for dispatcher, payload in self._encode_for_dispatchers(event, *args, **kwargs):
+            if isinstance(dispatcher, EventRemoteURLDispatcher) and payload is not None:
+                self.create_task(dispatcher.dispatch_payload, payload)
+            else:
+                self.create_task(dispatcher.dispatch, event, *args, **kwargs)
 
-        for target in self.targets:
-            dispatcher = dispatcher_factory.create(target)
+    def _encode_for_dispatchers(
+        self, event: Any, *args, **kwargs
+    ) -> Iterator[Tuple[EventRemoteDispatcher, Optional[bytes]]]:
+        """
+        Get the dispatchers interested in an event along with its encoded payload.
 
-            if target.events is None or event in target.events:
-                self.create_task(dispatcher.dispatch, event, *args, **kwargs)
+        Every URL target receives the same body, so the event is encoded only once.
+
+        Args:
+            event (Any): The emitted event.
+            *args: Variable length argument list for the event.
+            **kwargs: Arbitrary keyword arguments for the event.
+
+        Returns:
+            Iterator[Tuple[EventRemoteDispatcher, Optional[bytes]]]: The matching
+                dispatchers, with the payload for URL dispatchers and None otherwise.
+        """
+        payload: Optional[bytes] = None
+
+        for dispatcher in self._match_dispatchers(event):
+            if not isinstance(dispatcher, EventRemoteURLDispatcher):
+                yield dispatcher, None
+                continue
+
+            if payload is None:
+                try:
+                    payload = dispatcher.encode_request(event, *args, **kwargs)
+                except Exception:
+                    # Let the error surface in the dispatch, not while encoding
+                    yield dispatcher, None
+                    continue
+
+            yield dispatcher, payload
+
+    def _match_dispatchers(self, event: Any) -> Iterable[EventRemoteDispatcher]:
+        """
+        Get the dispatchers of the targets interested in an event.
+
+        Args:
+            event (Any): The emitted event.
+
+        Returns:
+            Iterable[EventRemoteDispatcher]: The matching dispatchers.
+        """
+        event_dispatchers = self._dispatcher_map.get(event)
+
+        # Most handlers only have one kind of target, skip chaining in that case
+        if not event_dispatchers:
+            return self._wildcard_dispatchers
+
+        if not self._wildcard_dispatchers:
+            return event_dispatchers
+
+        return chain(self._wildcard_dispatchers, event_dispatchers)
+
+    def flush(self) -> None:
+        """Send the events buffered by every registered dispatcher."""
+        dispatchers = chain(self._wildcard_dispatchers, *self._dispatcher_map.values())
+
+        # A dispatcher is listed once per event it is interested in
+        for dispatcher in {id(d): d for d in dispatchers}.values():
+            dispatcher.flush()
+
+    def wait_for_all(self) -> None:
+        """Wait for all asynchronous tasks to complete and flush buffered events."""
+        super().wait_for_all()
+        self.flush()
+
+    def _get_async_client(self) -> Optional[AsyncClient]:
+        """
+        Get the HTTP client shared by all URL dispatchers, creating it on first use.
+
+        The client's connections belong to the event loop that created it, so a new
+        client is created whenever the running loop changes.
+
+        Returns:
+            Optional[AsyncClient]: The shared client, or None if httpx is not installed.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._async_client_loop is loop:
+            return self._async_client
+
+        # Looking the module up scans sys.path, only do it once
+        if self._httpx_installed is None:
+            self._httpx_installed = is_module_installed("httpx")
+
+        if not self._httpx_installed:
+            return None
+
+        self._drop_async_client()
+        self._async_client = get_module("httpx").AsyncClient()
+        self._async_client_loop = loop
+
+        return self._async_client
+
+    def _drop_async_client(self) -> None:
+        """
+        Drop the HTTP client of a previous event loop, closing it on its loop if it runs.
+
+        A client can only be closed on the loop that created it, if that loop is no
+        longer running its connections are released when the client is collected.
+        """
+        client, loop = self._async_client, self._async_client_loop
+        self._async_client = None
+        self._async_client_loop = None
+
+        if client is not None and loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client shared by the URL dispatchers, if it was created."""
+        if self._async_client is None:
+            return
+
+        await self._async_client.aclose()
+        self._async_client = None
+        self._async_client_loop = None
+
+    async def emit_async(self, event: Any, *args, **kwargs) -> None:
+        """
+        Emit an event to all registered remote targets and wait for every dispatch.
+
+        URL targets are posted concurrently through a shared httpx client when httpx
+        is installed (eolic[httpx]).
+
+        Args:
+            event (Any): The event to emit.
+            *args: Variable length argument list for the event.
+            **kwargs: Arbitrary keyword arguments for the event.
+        """
+        client = self._get_async_client()
+
+        await asyncio.gather(
+            *[
+                (
+                    dispatcher.dispatch_payload_async(client, payload)
+                    if isinstance(dispatcher, EventRemoteURLDispatcher)
+                    and payload is not None
+                    else dispatcher.dispatch_async(client, event, *args, **kwargs)
+                )
+                for dispatcher, payload in self._encode_for_dispatchers(
+                    event, *args, **kwargs
+                )
+            ]
+        )
 
 
 class EventRemoteDispatcherFactory:
     """Factory class for creating event remote dispatchers."""
 
+    def __init__(
+        self, executor: Optional[Executor] = None, max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the factory.
+
+        Args:
+            executor (Optional[Executor]): Executor given to the created dispatchers.
+            max_workers (Optional[int]): Maximum number of threads of the executor, used
+                to size the connection pools of the URL dispatchers.
+        """
+        self.executor = executor
+        self.max_workers = max_workers
+
     def create(self, target: EventRemoteTarget) -> EventRemoteDispatcher:
         """
         Create a dispatcher for a given remote target.
@@ -170,10 +487,15 @@ class EventRemoteDispatcherFactory:
             NotImplementedError: If the target type is not implemented.
         """
         if isinstance(target, EventRemoteURLTarget):
-            return EventRemoteURLDispatcher(target)
+            if target.batch_size is not None:
+                return EventRemoteURLBatchDispatcher(
+                    target, self.executor, self.max_workers
+                )
+
+            return EventRemoteURLDispatcher(target, self.executor, self.max_workers)
 
         if isinstance(target, EventRemoteCeleryTarget):
-            return EventRemoteCeleryDispatcher(target)
+            return EventRemoteCeleryDispatcher(target, self.executor)
 
         raise NotImplementedError(
             f"EventRemoteDispatcher for {target.type} not implemented"
@@ -181,7 +503,62 @@ class EventRemoteDispatcherFactory:
 
 
 class EventRemoteDispatcher(ABC):
-    """Abstract base class for event remote dispatchers."""
+    """
+    Abstract base class for event remote dispatchers.
+
+    Attributes:
+        executor (Optional[Executor]): Executor running blocking calls, the event loop
+            default executor if None.
+        _event_cache (Dict[Enum, Any]): Mapping of Enum events to their values.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None) -> None:
+        """
+        Initialize the dispatcher.
+
+        Args:
+            executor (Optional[Executor]): Executor running blocking calls.
+        """
+        self.executor = executor
+        self._event_cache: Dict[Enum, Any] = {}
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call in the executor without blocking the event loop.
+
+        Args:
+            fn (Callable[..., Any]): The blocking function to call.
+            *args: Variable length argument list for the function.
+            **kwargs: Arbitrary keyword arguments for the function.
+
+        Returns:
+            Any: The result of the call.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    def _coerce_event(self, event: Any) -> Any:
+        """
+        Convert an event to the value sent to the remote target.
+
+        Enum events are sent as their value, any other event as its string. Only Enum
+        members are cached: they are finite, and caching other events by equality would
+        mix up values such as 1, 1.0 and True.
+
+        Args:
+            event (Any): The event to convert.
+
+        Returns:
+            Any: The serialized event value.
+        """
+        if not isinstance(event, Enum):
+            return str(event)
+
+        try:
+            return self._event_cache[event]
+        except KeyError:
+            event_value = self._event_cache[event] = event.value
+            return event_value
 
     @abstractmethod
     async def dispatch(self, event: Any, *args, **kwargs) -> None:
@@ -198,22 +575,68 @@ class EventRemoteDispatcher(ABC):
         """
         raise NotImplementedError("Dispatch should be implemented.")
 
+    async def dispatch_async(
+        self, client: Optional[AsyncClient], event: Any, *args, **kwargs
+    ) -> None:
+        """
+        Dispatch an event to the remote target without blocking the event loop.
+
+        Dispatchers that don't use the HTTP client fall back to dispatch.
+
+        Args:
+            client (Optional[AsyncClient]): The shared HTTP client, if available.
+            event (Any): The event to dispatch.
+            *args: Variable length argument list for the event.
+            **kwargs: Arbitrary keyword arguments for the event.
+        """
+        await self.dispatch(event, *args, **kwargs)
+
+    def flush(self) -> None:
+        """Send any buffered events to the remote target, if the dispatcher buffers them."""
+
 
 class EventRemoteURLDispatcher(EventRemoteDispatcher):
     """Dispatcher for URL remote targets."""
 
-    def __init__(self, target: EventRemoteURLTarget) -> None:
+    def __init__(
+        self,
+        target: EventRemoteURLTarget,
+        executor: Optional[Executor] = None,
+        pool_maxsize: Optional[int] = None,
+    ) -> None:
         """
         Initialize the URL dispatcher with a target.
 
         Args:
             target (EventRemoteURLTarget): The URL remote target.
+            executor (Optional[Executor]): Executor running the blocking requests.
+            pool_maxsize (Optional[int]): Maximum number of kept-alive connections, should
+                match the executor threads, the requests default (10) if None.
         """
+        super().__init__(executor)
         self.target = target
+        # requests is imported on first use to keep it off the import path
+        self.session: Session = get_module("requests").Session()
+
+        # Every executor thread may post at once, keep a connection for each of them
+        if pool_maxsize is not None:
+            adapter = get_module("requests.adapters").HTTPAdapter(
+                pool_connections=1, pool_maxsize=pool_maxsize
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+        # Payloads are posted as encoded bytes, keep a Content-Type set by the target
+        self.headers: Dict[str, str] = dict(self.target.headers)
+
+        if not any(name.lower() == "content-type" for name in self.headers):
+            self.headers["Content-Type"] = "application/json"
+
+        self.session.headers.update(self.headers)
 
-    def _build_request(self, event: Any, *args, **kwargs) -> Dict[str, Any]:
+    def encode_request(self, event: Any, *args, **kwargs) -> bytes:
         """
-        Build the request payload for the event.
+        Encode the request payload for the event as JSON.
 
         Args:
             event (Any): The event to dispatch.
@@ -221,15 +644,13 @@ class EventRemoteURLDispatcher(EventRemoteDispatcher):
             **kwargs: Arbitrary keyword arguments for the event.
 
         Returns:
-            Dict[str, Any]: The payload to send to the remote target.
+            bytes: The JSON payload to send to the remote target.
         """
-        event_value = str(event)
-
-        if isinstance(event, Enum):
-            event_value = event.value
-
-        dto = EventDTO(event=event_value, args=args, kwargs=kwargs)
-        return dto.model_dump()
+        # Same shape as EventDTO.model_dump_json(), built directly to skip pydantic
+        # validation, models and dataclasses in args/kwargs are still dumped
+        return to_json(
+            {"event": self._coerce_event(event), "args": args, "kwargs": kwargs}
+        )
 
     async def dispatch(self, event: Any, *args, **kwargs) -> None:
         """
@@ -240,25 +661,164 @@ class EventRemoteURLDispatcher(EventRemoteDispatcher):
             *args: Variable length argument list for the event.
             **kwargs: Arbitrary keyword arguments for the event.
         """
-        response = requests.post(
+        await self.dispatch_payload(self.encode_request(event, *args, **kwargs))
+
+    async def dispatch_payload(self, payload: bytes) -> None:
+        """
+        Dispatch an already encoded event to the URL remote target.
+
+        Args:
+            payload (bytes): The JSON payload built by encode_request.
+        """
+        response = await self._run_blocking(
+            self.session.post,
             self.target.address,
-            json=self._build_request(event, *args, **kwargs),
-            headers=self.target.headers,
+            data=payload,
             timeout=10,
         )
         logging.debug(f"Response from {self.target.address}: {response.status_code}")
 
+    async def dispatch_async(
+        self, client: Optional[AsyncClient], event: Any, *args, **kwargs
+    ) -> None:
+        """
+        Dispatch the event to the URL remote target through the shared HTTP client.
+
+        Args:
+            client (Optional[AsyncClient]): The shared HTTP client, if available.
+            event (Any): The event to dispatch.
+            *args: Variable length argument list for the event.
+            **kwargs: Arbitrary keyword arguments for the event.
+        """
+        await self.dispatch_payload_async(
+            client, self.encode_request(event, *args, **kwargs)
+        )
+
+    async def dispatch_payload_async(
+        self, client: Optional[AsyncClient], payload: bytes
+    ) -> None:
+        """
+        Dispatch an already encoded event through the shared HTTP client.
+
+        Args:
+            client (Optional[AsyncClient]): The shared HTTP client, if available.
+            payload (bytes): The JSON payload built by encode_request.
+        """
+        if client is None:
+            return await self.dispatch_payload(payload)
+
+        response = await client.post(
+            self.target.address,
+            content=payload,
+            headers=self.headers,
+            timeout=10,
+        )
+        logging.debug(f"Response from {self.target.address}: {response.status_code}")
+
+
+class EventRemoteURLBatchDispatcher(EventRemoteURLDispatcher):
+    """
+    Dispatcher for URL remote targets that sends events in batches.
+
+    Events are buffered and posted together as {"events": [...]} once the batch reaches
+    the target batch_size or the oldest buffered event waited flush_interval_ms.
+    """
+
+    def __init__(
+        self,
+        target: EventRemoteURLTarget,
+        executor: Optional[Executor] = None,
+        pool_maxsize: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the URL batch dispatcher with a target.
+
+        Args:
+            target (EventRemoteURLTarget): The URL remote target.
+            executor (Optional[Executor]): Executor running the blocking requests.
+            pool_maxsize (Optional[int]): Maximum number of kept-alive connections.
+        """
+        super().__init__(target, executor, pool_maxsize)
+        self._queue: Deque[bytes] = deque()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    async def dispatch_payload(self, payload: bytes) -> None:
+        """
+        Buffer an already encoded event, sending the batch if it is full.
+
+        Args:
+            payload (bytes): The JSON payload built by encode_request.
+        """
+        with self._lock:
+            self._queue.append(payload)
+            is_full = len(self._queue) >= (self.target.batch_size or 1)
+
+            if not is_full and self._timer is None:
+                self._timer = threading.Timer(
+                    self.target.flush_interval_ms / 1000, self.flush
+                )
+                self._timer.daemon = True
+                self._timer.start()
+
+        if is_full:
+            await self._run_blocking(self.flush)
+
+    async def dispatch_payload_async(
+        self, client: Optional[AsyncClient], payload: bytes
+    ) -> None:
+        """
+        Buffer an already encoded event, sending the batch if it is full.
+
+        Args:
+            client (Optional[AsyncClient]): The shared HTTP client, unused for batches.
+            payload (bytes): The JSON payload built by encode_request.
+        """
+        await self.dispatch_payload(payload)
+
+    def flush(self) -> None:
+        """Send the buffered events to the URL remote target in a single request."""
+        with self._lock:
+            batch, self._queue = self._queue, deque()
+
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not batch:
+            return
+
+        response = self.session.post(
+            self.target.address,
+            data=b'{"events":[' + b",".join(batch) + b"]}",
+            timeout=10,
+        )
+
+        # A rejected batch drops every event in it, don't let it pass silently
+        if not response.ok:
+            logging.warning(
+                f"Batch of {len(batch)} events rejected by {self.target.address}: "
+                f"{response.status_code}"
+            )
+            return
+
+        logging.debug(f"Response from {self.target.address}: {response.status_code}")
+
 
 class EventRemoteCeleryDispatcher(EventRemoteDispatcher):
     """Dispatcher for Celery remote targets."""
 
-    def __init__(self, target: EventRemoteCeleryTarget) -> None:
+    def __init__(
+        self, target: EventRemoteCeleryTarget, executor: Optional[Executor] = None
+    ) -> None:
         """
         Initialize the Celery dispatcher with a target.
 
         Args:
             target (EventRemoteCeleryTarget): The Celery remote target.
+            executor (Optional[Executor]): Executor running the blocking task sends.
         """
+        super().__init__(executor)
         self.target = target
 
         if not is_module_installed("celery"):
@@ -268,6 +828,8 @@ class EventRemoteCeleryDispatcher(EventRemoteDispatcher):
             )
 
         self.celery = get_module("celery").Celery(self.target.address)
+        self._function_name = self.target.function_name
+        self._queue_name = self.target.queue_name
 
     async def dispatch(self, event: Any, *args, **kwargs) -> None:
         """
@@ -278,16 +840,12 @@ class EventRemoteCeleryDispatcher(EventRemoteDispatcher):
             *args: Variable length argument list for the event.
             **kwargs: Arbitrary keyword arguments for the event.
         """
-        event_value = str(event)
-
-        if isinstance(event, Enum):
-            event_value = event.value
-
-        task = self.celery.send_task(
-            self.target.function_name,
-            args=[event_value, *args],
+        task = await self._run_blocking(
+            self.celery.send_task,
+            self._function_name,
+            args=(self._coerce_event(event), *args),
             kwargs=kwargs,
-            queue=self.target.queue_name,
+            queue=self._queue_name,
         )
 
         logging.debug(f"Celery task id {task}")
@@ -3,15 +3,34 @@
 import asyncio
 import atexit
 import signal
-from typing import Any, Callable
+from typing import Any, Callable, Set
 from .helpers.coroutines import run_coroutine
 
 
 class TaskManager:
-    """Handles the creation and management of asynchronous tasks."""
+    """
+    Handles the creation and management of asynchronous tasks.
 
-    def __init__(self) -> None:
-        """Initialize the TaskManager."""
+    Attributes:
+        _pending (Set[asyncio.Task]): Tracked tasks created by this manager that are still
+            running, awaited by wait_for_all.
+        _background (Set[asyncio.Task]): Untracked tasks that are still running, only
+            referenced so that they are not garbage collected.
+        _track_tasks (bool): Whether created tasks are kept in _pending.
+    """
+
+    def __init__(self, track_tasks: bool = True) -> None:
+        """
+        Initialize the TaskManager.
+
+        Args:
+            track_tasks (bool): Whether to keep track of created tasks. When False,
+                tasks are fire-and-forget and wait_for_all doesn't wait for them, so
+                they only progress while the event loop is running.
+        """
+        self._pending: Set[asyncio.Task] = set()
+        self._background: Set[asyncio.Task] = set()
+        self._track_tasks = track_tasks
         self._register_cleanup()
 
     def _register_cleanup(self) -> None:
@@ -37,7 +56,13 @@ class TaskManager:
             else:
                 await func(*args, **kwargs)
 
-        asyncio.create_task(_async_func())
+        task = asyncio.create_task(_async_func())
+
+        # The loop only keeps weak references to tasks, so untracked ones are also
+        # referenced, just not awaited by wait_for_all. Finished tasks remove themselves
+        tasks = self._pending if self._track_tasks else self._background
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
 
     def wait_for_all(self) -> None:
         """Wait for all asynchronous tasks to complete."""
@@ -45,5 +70,4 @@ class TaskManager:
 
     async def _wait_for_all_async(self) -> None:
         """Asynchronously wait for all tasks to complete."""
-        pending = asyncio.all_tasks() - {asyncio.current_task()}
-        await asyncio.gather(*pending)
+        await asyncio.gather(*list(self._pending))
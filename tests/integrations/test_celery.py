@@ -229,13 +229,27 @@ async def test_target_celery_handler(
 
         event = "event"
 
+    calls = []
+
     def send_task_mock(function_name: str, *args, **kwargs):
-        print("{} - {} - {}".format(function_name, args, kwargs))
+        calls.append((function_name, args, kwargs))
 
     monkeypatch.setattr(target_celery_handler.celery, "send_task", send_task_mock)
 
     await target_celery_handler.dispatch(Events.event, "1", "2", "3", k={"4": "4"})
 
+    assert calls == [
+        (
+            "events",
+            (),
+            {
+                "args": ("event", "1", "2", "3"),
+                "kwargs": {"k": {"4": "4"}},
+                "queue": "eolic",
+            },
+        )
+    ]
+
 
 async def test_event_remote_dispatcher_factory(
     target_celery_handler: EventRemoteCeleryDispatcher,
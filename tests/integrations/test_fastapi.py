@@ -1,12 +1,15 @@
 import importlib.util
+from unittest.mock import patch
 
 import pytest
+import requests
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from eolic.base import Eolic
 from eolic.integrations.fastapi import FastAPIIntegration
-from eolic.model import EventDTO
+from eolic.model import EventDTO, EventRemoteURLTarget
+from eolic.remote import EventRemoteURLBatchDispatcher
 
 
 @pytest.fixture
@@ -80,6 +83,49 @@ def test_fastapi_integration_setup(eolic: Eolic, app: FastAPI, event_dto: EventD
     assert response.json() == {}
 
 
+async def test_fastapi_integration_receives_batches(eolic: Eolic, app: FastAPI):
+    """
+    Test that a batch posted by a batching URL target is forwarded event by event.
+
+    Args:
+        eolic (Eolic): The Eolic instance.
+        app (FastAPI): The FastAPI app instance.
+    """
+    integration = FastAPIIntegration(app=app)
+    integration.setup(eolic)
+    client = TestClient(app)
+
+    target = EventRemoteURLTarget(
+        type="url", address="/events", batch_size=2, flush_interval_ms=60000
+    )
+    dispatcher = EventRemoteURLBatchDispatcher(target)
+
+    responses = []
+
+    def post(url, data, timeout):
+        # The dispatcher posts through requests, the test client answers with httpx
+        response = requests.Response()
+        response.status_code = client.post(
+            url, content=data, headers=dispatcher.session.headers
+        ).status_code
+        responses.append(response)
+        return response
+
+    with patch.object(
+        dispatcher.session, "post", side_effect=post
+    ) as mock_post, patch.object(eolic.listener_handler, "emit") as mock_emit:
+        await dispatcher.dispatch("test_event", "arg1", key="value")
+        await dispatcher.dispatch("other_event")
+
+    assert mock_post.call_count == 1
+    assert responses[0].status_code == 200
+    assert [call.args for call in mock_emit.call_args_list] == [
+        ("test_event", "arg1"),
+        ("other_event",),
+    ]
+    assert mock_emit.call_args_list[0].kwargs == {"key": "value"}
+
+
 def test_fastapi_integration_no_app():
     """
     Test that an exception is raised when FastAPIIntegration is initialized with no app.
@@ -0,0 +1,75 @@
+"""
+Module for testing the eolic Settings.
+
+This module includes tests for the default settings and for overriding
+them through environment variables.
+"""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from eolic.config import Settings, get_settings
+
+
+def test_default_max_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the default max_workers setting.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+    """
+    monkeypatch.delenv("EOLIC_MAX_WORKERS", raising=False)
+
+    assert Settings.from_env().max_workers == min(32, (os.cpu_count() or 1) + 4)
+
+
+def test_max_workers_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test overriding max_workers with an environment variable.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv("EOLIC_MAX_WORKERS", "3")
+
+    assert Settings.from_env().max_workers == 3
+
+
+@pytest.mark.parametrize("max_workers", ["0", "-1"])
+def test_invalid_max_workers_from_env(
+    monkeypatch: pytest.MonkeyPatch, max_workers: str
+) -> None:
+    """
+    Test that a non-positive max_workers is rejected by the settings validation.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+        max_workers (str): The invalid EOLIC_MAX_WORKERS value.
+    """
+    monkeypatch.setenv("EOLIC_MAX_WORKERS", max_workers)
+
+    with pytest.raises(ValidationError, match="max_workers"):
+        Settings.from_env()
+
+
+def test_get_settings_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the settings are read once until the cache is cleared.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+    """
+    get_settings.cache_clear()
+    monkeypatch.setenv("EOLIC_MAX_WORKERS", "3")
+    settings = get_settings()
+
+    monkeypatch.setenv("EOLIC_MAX_WORKERS", "4")
+    assert get_settings() is settings
+    assert get_settings().max_workers == 3
+
+    get_settings.cache_clear()
+    assert get_settings().max_workers == 4
+
+    get_settings.cache_clear()
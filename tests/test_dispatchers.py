@@ -5,11 +5,17 @@ This module includes tests for creating dispatchers, dispatching events,
 handling errors, and validating event remote targets.
 """
 
-from pydantic import ValidationError
+import json
+from dataclasses import dataclass
+from enum import IntEnum
+
+from pydantic import BaseModel, ValidationError
 import pytest
+from pydantic_core import to_json
 from eolic.model import EventRemoteTarget
 from eolic.remote import (
     EventRemoteDispatcherFactory,
+    EventRemoteURLBatchDispatcher,
     EventRemoteURLDispatcher,
     EventRemoteURLTarget,
 )
@@ -60,6 +66,20 @@ def test_create_url_dispatcher(
     dispatcher = dispatcher_factory.create(url_target)
     assert isinstance(dispatcher, EventRemoteURLDispatcher)
     assert dispatcher.target == url_target
+    assert dispatcher.session.headers["X-Api-Key"] == "test"
+    assert dispatcher.session.headers["Content-Type"] == "application/json"
+
+
+def test_url_dispatcher_keeps_target_content_type() -> None:
+    """Test that a Content-Type set on the target is not overridden."""
+    target = EventRemoteURLTarget(
+        type="url",
+        address="https://a/test-url",
+        headers={"content-type": "application/cloudevents+json"},
+    )
+    dispatcher = EventRemoteURLDispatcher(target)
+
+    assert dispatcher.session.headers["Content-Type"] == "application/cloudevents+json"
 
 
 # Dispatching Events
@@ -77,17 +97,18 @@ async def test_dispatch_event_to_url(
     """
     dispatcher = EventRemoteURLDispatcher(url_target)
 
-    mock_post = mocker.patch("requests.post")
+    mock_post = mocker.patch("requests.Session.post")
     await dispatcher.dispatch(GameEvents.ON_PLAYER_JOIN, "Archer")
 
     mock_post.assert_called_once_with(
         "https://a/test-url",
-        json={
-            "event": GameEvents.ON_PLAYER_JOIN.value,
-            "args": ("Archer",),
-            "kwargs": {},
-        },
-        headers={"X-Api-Key": "test"},
+        data=to_json(
+            {
+                "event": GameEvents.ON_PLAYER_JOIN.value,
+                "args": ("Archer",),
+                "kwargs": {},
+            }
+        ),
         timeout=10,
     )
 
@@ -104,17 +125,18 @@ async def test_dispatch_event_to_url_with_different_event(
     """
     dispatcher = EventRemoteURLDispatcher(url_target)
 
-    mock_post = mocker.patch("requests.post")
+    mock_post = mocker.patch("requests.Session.post")
     await dispatcher.dispatch(GameEvents.ON_PLAYER_ATTACK, "Archer", "Goblin", 30)
 
     mock_post.assert_called_once_with(
         "https://a/test-url",
-        json={
-            "event": GameEvents.ON_PLAYER_ATTACK.value,
-            "args": ("Archer", "Goblin", 30),
-            "kwargs": {},
-        },
-        headers={"X-Api-Key": "test"},
+        data=to_json(
+            {
+                "event": GameEvents.ON_PLAYER_ATTACK.value,
+                "args": ("Archer", "Goblin", 30),
+                "kwargs": {},
+            }
+        ),
         timeout=10,
     )
 
@@ -131,22 +153,213 @@ async def test_dispatcher_error_handling(
     """
     dispatcher = EventRemoteURLDispatcher(url_target)
 
-    mock_post = mocker.patch("requests.post", side_effect=Exception("Request failed"))
+    mock_post = mocker.patch(
+        "requests.Session.post", side_effect=Exception("Request failed")
+    )
     with pytest.raises(Exception, match="Request failed"):
         await dispatcher.dispatch(GameEvents.ON_PLAYER_JOIN, "Archer")
 
     mock_post.assert_called_once_with(
         "https://a/test-url",
-        json={
-            "event": GameEvents.ON_PLAYER_JOIN.value,
-            "args": ("Archer",),
-            "kwargs": {},
-        },
-        headers={"X-Api-Key": "test"},
+        data=to_json(
+            {
+                "event": GameEvents.ON_PLAYER_JOIN.value,
+                "args": ("Archer",),
+                "kwargs": {},
+            }
+        ),
         timeout=10,
     )
 
 
+async def test_dispatch_event_with_model_args(
+    mocker: MockFixture, url_target: EventRemoteURLTarget
+) -> None:
+    """
+    Test dispatching an event with pydantic models and dataclasses as arguments.
+
+    Args:
+        mocker (MockFixture): The mock fixture for patching.
+        url_target (EventRemoteURLTarget): An instance of EventRemoteURLTarget.
+    """
+
+    class Player(BaseModel):
+        id: int
+
+    @dataclass
+    class Monster:
+        name: str
+
+    dispatcher = EventRemoteURLDispatcher(url_target)
+
+    mock_post = mocker.patch("requests.Session.post")
+    await dispatcher.dispatch(
+        GameEvents.ON_PLAYER_ATTACK, Player(id=1), monster=Monster(name="Goblin")
+    )
+
+    assert json.loads(mock_post.call_args.kwargs["data"]) == {
+        "event": GameEvents.ON_PLAYER_ATTACK.value,
+        "args": [{"id": 1}],
+        "kwargs": {"monster": {"name": "Goblin"}},
+    }
+
+
+def test_coerce_event_is_cached(url_target: EventRemoteURLTarget) -> None:
+    """
+    Test that only Enum events are cached when serialized.
+
+    Args:
+        url_target (EventRemoteURLTarget): An instance of EventRemoteURLTarget.
+    """
+    dispatcher = EventRemoteURLDispatcher(url_target)
+
+    assert dispatcher._coerce_event(GameEvents.ON_PLAYER_JOIN) == "ON_PLAYER_JOIN"
+    assert dispatcher._coerce_event(42) == "42"
+    assert dispatcher._event_cache == {GameEvents.ON_PLAYER_JOIN: "ON_PLAYER_JOIN"}
+
+
+def test_coerce_equal_events(url_target: EventRemoteURLTarget) -> None:
+    """
+    Test that events comparing equal keep their own serialized values.
+
+    Args:
+        url_target (EventRemoteURLTarget): An instance of EventRemoteURLTarget.
+    """
+
+    class Level(IntEnum):
+        A = 1
+
+    dispatcher = EventRemoteURLDispatcher(url_target)
+
+    assert dispatcher._coerce_event(1) == "1"
+    assert dispatcher._coerce_event(True) == "True"
+    assert dispatcher._coerce_event(1.0) == "1.0"
+    assert dispatcher._coerce_event(Level.A) == 1
+
+
+def test_url_dispatcher_pool_size(url_target: EventRemoteURLTarget) -> None:
+    """
+    Test that the factory sizes the URL dispatcher connection pool to max_workers.
+
+    Args:
+        url_target (EventRemoteURLTarget): The URL remote target.
+    """
+    dispatcher = EventRemoteDispatcherFactory(max_workers=20).create(url_target)
+    assert isinstance(dispatcher, EventRemoteURLDispatcher)
+
+    for address in ("http://a/test-url", "https://a/test-url"):
+        assert dispatcher.session.get_adapter(address)._pool_maxsize == 20
+
+
+async def test_batch_dispatcher_sends_full_batches(mocker: MockFixture) -> None:
+    """
+    Test that the batch dispatcher sends events together once the batch is full.
+
+    Args:
+        mocker (MockFixture): The mock fixture for patching.
+    """
+    target = EventRemoteURLTarget(
+        type="url", address="https://a/test-url", batch_size=2, flush_interval_ms=60000
+    )
+    dispatcher = EventRemoteDispatcherFactory().create(target)
+    assert isinstance(dispatcher, EventRemoteURLBatchDispatcher)
+
+    mock_post = mocker.patch("requests.Session.post")
+    await dispatcher.dispatch(GameEvents.ON_PLAYER_JOIN, "Archer")
+    mock_post.assert_not_called()
+
+    await dispatcher.dispatch(GameEvents.ON_GAME_OVER)
+    mock_post.assert_called_once_with(
+        "https://a/test-url",
+        data=to_json(
+            {
+                "events": [
+                    {
+                        "event": GameEvents.ON_PLAYER_JOIN.value,
+                        "args": ("Archer",),
+                        "kwargs": {},
+                    },
+                    {"event": GameEvents.ON_GAME_OVER.value, "args": (), "kwargs": {}},
+                ]
+            }
+        ),
+        timeout=10,
+    )
+
+    dispatcher.flush()
+    mock_post.assert_called_once()
+
+
+async def test_batch_dispatcher_flushes_on_interval(mocker: MockFixture) -> None:
+    """
+    Test that the batch dispatcher sends a partial batch after the flush interval.
+
+    Args:
+        mocker (MockFixture): The mock fixture for patching.
+    """
+    target = EventRemoteURLTarget(
+        type="url", address="https://a/test-url", batch_size=10, flush_interval_ms=1
+    )
+    dispatcher = EventRemoteURLBatchDispatcher(target)
+
+    mock_post = mocker.patch("requests.Session.post")
+    await dispatcher.dispatch(GameEvents.ON_PLAYER_JOIN, "Archer")
+
+    assert dispatcher._timer is not None
+    dispatcher._timer.join()
+
+    mock_post.assert_called_once()
+    assert len(json.loads(mock_post.call_args.kwargs["data"])["events"]) == 1
+
+
+async def test_batch_dispatcher_warns_on_rejected_batch(
+    mocker: MockFixture, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Test that the batch dispatcher logs a warning when the target rejects a batch.
+
+    Args:
+        mocker (MockFixture): The mock fixture for patching.
+        caplog (pytest.LogCaptureFixture): The fixture capturing log records.
+    """
+    target = EventRemoteURLTarget(
+        type="url", address="https://a/test-url", batch_size=1, flush_interval_ms=60000
+    )
+    dispatcher = EventRemoteURLBatchDispatcher(target)
+
+    mock_post = mocker.patch("requests.Session.post")
+    mock_post.return_value.ok = False
+    mock_post.return_value.status_code = 422
+
+    with caplog.at_level("WARNING"):
+        await dispatcher.dispatch(GameEvents.ON_PLAYER_JOIN, "Archer")
+
+    assert "Batch of 1 events rejected by https://a/test-url: 422" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "batch_settings",
+    [
+        {"batch_size": 0},
+        {"batch_size": -1},
+        {"flush_interval_ms": 0},
+        {"flush_interval_ms": -100},
+    ],
+)
+def test_invalid_batch_settings(batch_settings: dict) -> None:
+    """
+    Test that non-positive batch settings are rejected.
+
+    Args:
+        batch_settings (dict): The invalid batch settings.
+
+    Raises:
+        ValidationError: If a batch setting is not greater than 0.
+    """
+    with pytest.raises(ValidationError):
+        EventRemoteURLTarget(type="url", address="https://a/test-url", **batch_settings)
+
+
 def test_invalid_event_remote_target() -> None:
     """
     Test validation of an invalid event remote target.
@@ -158,6 +371,20 @@ def test_invalid_event_remote_target() -> None:
         EventRemoteTarget(type="invalid", address="")
 
 
+def test_event_remote_target_is_frozen(url_target: EventRemoteURLTarget) -> None:
+    """
+    Test that remote targets can't be changed after creation.
+
+    Args:
+        url_target (EventRemoteURLTarget): An instance of EventRemoteURLTarget.
+
+    Raises:
+        ValidationError: If a target field is assigned.
+    """
+    with pytest.raises(ValidationError):
+        url_target.address = "https://a/other-url"
+
+
 def test_not_implemented_type() -> None:
     """
     Test handling of a not implemented target type.
@@ -9,6 +9,7 @@ from unittest.mock import patch
 from tests.common import GameEvents
 from pytest_mock import MockFixture
 import pytest
+from pydantic_core import to_json
 from eolic import Eolic
 
 from eolic.listener import EventListenerHandler
@@ -91,6 +92,66 @@ def test_register_invalid_target(eolic_instance: Eolic) -> None:
         eolic_instance.register_target(123)  # Invalid type
 
 
+@pytest.mark.parametrize(
+    "target",
+    [
+        "https://a/test-url",
+        {"type": "celery", "address": "redis://", "queue_name": None},
+        {"type": "celery", "address": "redis://", "queue_name": 5, "function_name": 6},
+        {
+            "type": "celery",
+            "address": "redis://",
+            "queue_name": "",
+            "function_name": "",
+        },
+    ],
+)
+def test_init_and_register_target_parse_alike(eolic_instance: Eolic, target) -> None:
+    """
+    Test that targets given on init are parsed like registered targets.
+
+    Args:
+        eolic_instance (Eolic): An instance of Eolic.
+        target: The remote target definition.
+    """
+    eolic_instance.register_target(target)
+    registered = list(eolic_instance.remote_target_handler.targets)
+
+    eolic_instance.remote_target_handler.clear()
+    Eolic._instances.clear()
+    eolic = Eolic(remote_targets=[target])
+
+    assert eolic.remote_target_handler.targets == registered
+
+
+@pytest.mark.parametrize(
+    "target, error",
+    [
+        (123, TypeError),
+        ({"type": 123}, TypeError),
+        ({"type": "rabbitmq", "address": ""}, NotImplementedError),
+    ],
+)
+def test_init_and_register_target_reject_alike(
+    eolic_instance: Eolic, target, error
+) -> None:
+    """
+    Test that invalid targets raise the same error on init and on registration.
+
+    Args:
+        eolic_instance (Eolic): An instance of Eolic.
+        target: The invalid remote target definition.
+        error: The expected exception type.
+    """
+    with pytest.raises(error):
+        eolic_instance.register_target(target)
+
+    Eolic._instances.clear()
+
+    with pytest.raises(error):
+        Eolic(remote_targets=[target])
+
+
 def test_emit_event_to_single_listener(eolic_instance: Eolic) -> None:
     """
     Test emitting an event to a single listener.
@@ -222,33 +283,44 @@ def test_remote_target_receives_event(
         }
     )
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         eolic_instance.emit(GameEvents.ON_PLAYER_JOIN, "Archer")
 
         eolic_instance.remote_target_handler.wait_for_all()
 
         mock_post.assert_called_once_with(
             "https://a/test-url",
-            json={
-                "event": GameEvents.ON_PLAYER_JOIN.value,
-                "args": ("Archer",),
-                "kwargs": {},
-            },
-            headers={"X-Api-Key": "test"},
+            data=to_json(
+                {
+                    "event": GameEvents.ON_PLAYER_JOIN.value,
+                    "args": ("Archer",),
+                    "kwargs": {},
+                }
+            ),
             timeout=10,
         )
 
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         eolic_instance.emit(GameEvents.ON_MONSTER_DEFEATED, "Archer")
         eolic_instance.remote_target_handler.wait_for_all()
 
         mock_post.assert_called_once_with(
             "https://a/test-url",
-            json={
-                "event": GameEvents.ON_MONSTER_DEFEATED.value,
-                "args": ("Archer",),
-                "kwargs": {},
-            },
-            headers={"X-Api-Key": "test"},
+            data=to_json(
+                {
+                    "event": GameEvents.ON_MONSTER_DEFEATED.value,
+                    "args": ("Archer",),
+                    "kwargs": {},
+                }
+            ),
             timeout=10,
         )
+
+
+def test_import_does_not_load_requests() -> None:
+    """Test that requests is only imported once a URL target is registered."""
+    import subprocess
+    import sys
+
+    code = "import sys, eolic; assert 'requests' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -5,10 +5,18 @@ This module includes tests for parsing, registering, and emitting events
 to remote targets using the EventRemoteTargetHandler class.
 """
 
-from unittest.mock import patch
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from pydantic import ValidationError
 
+from pydantic_core import to_json
+from eolic.config import get_settings
 from eolic.remote import EventRemoteTargetHandler, EventRemoteURLTarget
 from tests.common import GameEvents
 
@@ -70,6 +78,26 @@ def test_parse_dict_target(target_handler: EventRemoteTargetHandler) -> None:
     assert parsed_target.headers["X-Api-Key"] == "test"
 
 
+def test_parse_url_target_batch_defaults(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that omitted batch settings fall back to the model defaults.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    parsed_target = target_handler._parse_target(
+        {"type": "url", "address": "https://a/test-url", "batch_size": 5}
+    )
+
+    assert parsed_target.batch_size == 5
+    assert (
+        parsed_target.flush_interval_ms
+        == EventRemoteURLTarget.model_fields["flush_interval_ms"].default
+    )
+
+
 def test_parse_invalid_target(target_handler: EventRemoteTargetHandler) -> None:
     """
     Test handling of invalid target formats.
@@ -102,6 +130,33 @@ def test_event_remote_type_not_exists(target_handler: EventRemoteTargetHandler)
     target_handler._parse_target({"type": "rabbitmq", "address": ""})
 
 
+def test_parse_unknown_target_type(target_handler: EventRemoteTargetHandler) -> None:
+    """
+    Test handling of unknown target types.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    with pytest.raises(ValidationError):
+        target_handler._parse_target({"type": "invalid", "address": ""})
+
+
+def test_max_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test sizing the dispatch executor from the argument or the settings.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv("EOLIC_MAX_WORKERS", "3")
+    get_settings.cache_clear()
+
+    assert EventRemoteTargetHandler().executor._max_workers == 3
+    assert EventRemoteTargetHandler(max_workers=5).executor._max_workers == 5
+
+    get_settings.cache_clear()
+
+
 # Registering Targets
 
 
@@ -152,6 +207,112 @@ def test_register_duplicate_targets(target_handler: EventRemoteTargetHandler) ->
     )  # This assumes duplicates are allowed. Adjust as needed.
 
 
+def test_register_many_targets(target_handler: EventRemoteTargetHandler) -> None:
+    """
+    Test registering several targets at once.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    target_handler.register_many(
+        [
+            "https://a/target1",
+            {
+                "type": "url",
+                "address": "https://a/target2",
+                "events": [GameEvents.ON_PLAYER_JOIN],
+            },
+        ]
+    )
+
+    assert [target.address for target in target_handler.targets] == [
+        "https://a/target1",
+        "https://a/target2",
+    ]
+    assert all(isinstance(t, EventRemoteURLTarget) for t in target_handler.targets)
+    assert len(target_handler._wildcard_dispatchers) == 1
+    assert len(target_handler._dispatcher_map[GameEvents.ON_PLAYER_JOIN]) == 1
+
+
+def test_register_many_invalid_targets(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that no target is registered when one of them is invalid.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    with pytest.raises(ValidationError):
+        target_handler.register_many(
+            ["https://a/target1", {"type": "invalid", "address": ""}]
+        )
+
+    assert target_handler.targets == []
+
+
+async def test_emit_without_tracking_tasks() -> None:
+    """Test that fire-and-forget handlers dispatch without tracking their tasks."""
+    target_handler = EventRemoteTargetHandler(track_tasks=False)
+    target_handler.register("https://a/test-url")
+
+    with patch("requests.Session.post") as mock_post:
+        target_handler.emit(GameEvents.ON_PLAYER_JOIN, "Archer")
+        await asyncio.sleep(0)
+
+        assert not target_handler._pending
+        # Untracked tasks are still referenced so they can't be garbage collected
+        assert len(target_handler._background) == 1
+
+        for _ in range(100):
+            if mock_post.called and not target_handler._background:
+                break
+            await asyncio.sleep(0.01)
+
+        mock_post.assert_called_once()
+        assert not target_handler._background
+
+
+def test_handlers_do_not_share_targets(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that targets registered on one handler are not seen by another.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    target_handler.register("https://a/test-url")
+
+    other_handler = EventRemoteTargetHandler()
+
+    assert len(target_handler.targets) == 1
+    assert other_handler.targets == []
+    assert other_handler._wildcard_dispatchers == []
+
+
+def test_register_builds_dispatcher_once(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that dispatchers are built on registration and reused on emit.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    target_handler.register("https://a/test-url")
+
+    with patch("requests.Session.post") as mock_post, patch(
+        "eolic.remote.EventRemoteDispatcherFactory.create"
+    ) as mock_create:
+        target_handler.emit(GameEvents.ON_PLAYER_JOIN, "Archer")
+        target_handler.emit(GameEvents.ON_PLAYER_ATTACK, "Archer")
+        target_handler.wait_for_all()
+
+        mock_create.assert_not_called()
+        assert mock_post.call_count == 2
+
+
 # Emitting Events
 
 
@@ -162,7 +323,7 @@ def test_emit_event_to_single_target(target_handler: EventRemoteTargetHandler) -
     Args:
         target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
     """
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         target = {
             "type": "url",
             "address": "https://a/test-url",
@@ -173,12 +334,13 @@ def test_emit_event_to_single_target(target_handler: EventRemoteTargetHandler) -
         target_handler.wait_for_all()
         mock_post.assert_called_once_with(
             "https://a/test-url",
-            json={
-                "event": GameEvents.ON_PLAYER_JOIN.value,
-                "args": ("Archer",),
-                "kwargs": {},
-            },
-            headers={"X-Api-Key": "test"},
+            data=to_json(
+                {
+                    "event": GameEvents.ON_PLAYER_JOIN.value,
+                    "args": ("Archer",),
+                    "kwargs": {},
+                }
+            ),
             timeout=10,
         )
 
@@ -192,7 +354,7 @@ def test_emit_event_to_multiple_targets(
     Args:
         target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
     """
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         targets = [
             {
                 "type": "url",
@@ -210,6 +372,28 @@ def test_emit_event_to_multiple_targets(
         target_handler.emit(GameEvents.ON_PLAYER_JOIN, "Archer")
         target_handler.wait_for_all()
         assert mock_post.call_count == 2
+        assert not target_handler._pending
+
+        # The payload is encoded once and shared by every URL target
+        first_call, second_call = mock_post.call_args_list
+        assert first_call.kwargs["data"] is second_call.kwargs["data"]
+
+
+def test_emit_unserializable_event_fails_in_task(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that payload encoding errors surface in the dispatch task, not in emit.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    with patch("requests.Session.post") as mock_post:
+        target_handler.register("https://a/test-url")
+        target_handler.emit(GameEvents.ON_PLAYER_JOIN, object())
+        target_handler.wait_for_all()
+
+        mock_post.assert_not_called()
 
 
 def test_filter_targets_by_event(target_handler: EventRemoteTargetHandler) -> None:
@@ -219,7 +403,7 @@ def test_filter_targets_by_event(target_handler: EventRemoteTargetHandler) -> No
     Args:
         target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
     """
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.status_code = 200
         targets = [
             {
@@ -243,11 +427,286 @@ def test_filter_targets_by_event(target_handler: EventRemoteTargetHandler) -> No
 
         mock_post.assert_called_once_with(
             "https://a/target1",
-            json={
-                "event": GameEvents.ON_PLAYER_JOIN.value,
-                "args": ("Archer",),
-                "kwargs": {},
-            },
-            headers={"X-Api-Key": "key1"},
+            data=to_json(
+                {
+                    "event": GameEvents.ON_PLAYER_JOIN.value,
+                    "args": ("Archer",),
+                    "kwargs": {},
+                }
+            ),
             timeout=10,
         )
+
+
+def test_route_wildcard_and_filtered_targets(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test routing events to wildcard targets and to targets filtered by event.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    with patch("requests.Session.post") as mock_post:
+        target_handler.register("https://a/target1")
+        target_handler.register(
+            {
+                "type": "url",
+                "address": "https://a/target2",
+                "events": [GameEvents.ON_PLAYER_JOIN, GameEvents.ON_PLAYER_JOIN],
+            }
+        )
+
+        target_handler.emit(GameEvents.ON_PLAYER_JOIN, "Archer")
+        target_handler.wait_for_all()
+        assert mock_post.call_count == 2
+
+        mock_post.reset_mock()
+        target_handler.emit(GameEvents.ON_GAME_OVER)
+        target_handler.wait_for_all()
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.args[0] == "https://a/target1"
+
+
+async def test_emit_async_uses_shared_client(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test emitting an event asynchronously through the shared HTTP client.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    target_handler.register(
+        {
+            "type": "url",
+            "address": "https://a/target1",
+            "headers": {"X-Api-Key": "key1"},
+        }
+    )
+    target_handler.register("https://a/target2")
+
+    with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
+        await target_handler.emit_async(GameEvents.ON_PLAYER_JOIN, "Archer")
+
+        assert mock_post.call_count == 2
+        mock_post.assert_any_call(
+            "https://a/target1",
+            content=to_json(
+                {
+                    "event": GameEvents.ON_PLAYER_JOIN.value,
+                    "args": ["Archer"],
+                    "kwargs": {},
+                }
+            ),
+            headers={"X-Api-Key": "key1", "Content-Type": "application/json"},
+            timeout=10,
+        )
+
+        # The event is encoded once for every URL target
+        first_call, second_call = mock_post.call_args_list
+        assert first_call.kwargs["content"] is second_call.kwargs["content"]
+
+    assert target_handler._get_async_client() is target_handler._async_client
+
+
+def test_emit_async_in_consecutive_event_loops(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test emitting asynchronously from two event loops in a row.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append(json.loads(body))
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        target_handler.register(f"http://127.0.0.1:{server.server_port}/events")
+
+        asyncio.run(target_handler.emit_async(GameEvents.ON_PLAYER_JOIN, "Archer"))
+        first_client = target_handler._async_client
+
+        async def emit_and_close() -> None:
+            await target_handler.emit_async(GameEvents.ON_GAME_OVER)
+            assert target_handler._async_client is not first_client
+            await target_handler.aclose()
+
+        asyncio.run(emit_and_close())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [payload["event"] for payload in received] == [
+        GameEvents.ON_PLAYER_JOIN.value,
+        GameEvents.ON_GAME_OVER.value,
+    ]
+    assert target_handler._async_client is None
+
+
+def test_connection_pool_fits_max_workers(caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Test that concurrent dispatches keep their connections alive.
+
+    Args:
+        caplog (pytest.LogCaptureFixture): The fixture capturing log records.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            # Hold the request so that every worker posts at the same time
+            time.sleep(0.05)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    target_handler = EventRemoteTargetHandler(max_workers=20)
+
+    try:
+        target_handler.register(f"http://127.0.0.1:{server.server_port}/events")
+
+        with caplog.at_level("WARNING", logger="urllib3.connectionpool"):
+            for _ in range(20):
+                target_handler.emit(GameEvents.ON_PLAYER_JOIN, "Archer")
+
+            target_handler.wait_for_all()
+    finally:
+        server.shutdown()
+        server.server_close()
+        target_handler.executor.shutdown()
+
+    assert "Connection pool is full" not in caplog.text
+
+
+async def test_emit_async_without_httpx(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that emitting asynchronously falls back to requests without httpx.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    target_handler.register("https://a/test-url")
+
+    with patch(
+        "eolic.remote.is_module_installed", return_value=False
+    ) as mock_installed, patch("requests.Session.post") as mock_post:
+        await target_handler.emit_async(GameEvents.ON_PLAYER_JOIN, "Archer")
+        await target_handler.emit_async(GameEvents.ON_GAME_OVER)
+
+        assert mock_post.call_count == 2
+        mock_installed.assert_called_once_with("httpx")
+
+
+async def test_emit_async_closes_client_of_running_loop(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that the client of a loop still running elsewhere is closed when replaced.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    target_handler.register("https://a/test-url")
+
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    try:
+        with patch("httpx.AsyncClient.post", new_callable=AsyncMock):
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(
+                    target_handler.emit_async(GameEvents.ON_PLAYER_JOIN), other_loop
+                )
+            )
+            first_client = target_handler._async_client
+            assert first_client is not None
+
+            await target_handler.emit_async(GameEvents.ON_GAME_OVER)
+            assert target_handler._async_client is not first_client
+
+        for _ in range(100):
+            if first_client.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        assert first_client.is_closed
+        await target_handler.aclose()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+def test_match_single_kind_of_target(
+    target_handler: EventRemoteTargetHandler,
+) -> None:
+    """
+    Test that matching returns the routing list itself when no chaining is needed.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    target_handler.register(
+        {
+            "type": "url",
+            "address": "https://a/test-url",
+            "events": [GameEvents.ON_PLAYER_JOIN],
+        }
+    )
+
+    matched = target_handler._match_dispatchers(GameEvents.ON_PLAYER_JOIN)
+    assert matched is target_handler._dispatcher_map[GameEvents.ON_PLAYER_JOIN]
+    assert list(target_handler._match_dispatchers(GameEvents.ON_GAME_OVER)) == []
+
+
+def test_wait_for_all_flushes_batches(target_handler: EventRemoteTargetHandler) -> None:
+    """
+    Test that waiting for all tasks also sends buffered batches.
+
+    Args:
+        target_handler (EventRemoteTargetHandler): An instance of EventRemoteTargetHandler.
+    """
+    with patch("requests.Session.post") as mock_post:
+        target_handler.register(
+            {
+                "type": "url",
+                "address": "https://a/test-url",
+                "batch_size": 10,
+                "flush_interval_ms": 60000,
+                "events": [GameEvents.ON_PLAYER_JOIN, GameEvents.ON_GAME_OVER],
+            }
+        )
+        target_handler.emit(GameEvents.ON_PLAYER_JOIN, "Archer")
+        target_handler.emit(GameEvents.ON_GAME_OVER)
+        target_handler.wait_for_all()
+
+        mock_post.assert_called_once()
+        assert len(json.loads(mock_post.call_args.kwargs["data"])["events"]) == 2